@@ -10,26 +10,120 @@
 
 import sys
 import argparse
+import hashlib
+import json
+import mmap
+import re
+import socket
+import stat
+import threading
+import time
+import urllib.error
 import urllib.request
 from pathlib import Path
-from typing import List, Optional, Set
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.syntax import Syntax
+from typing import FrozenSet, List, Optional, Set
 
 try:
-    from licface import CustomRichHelpFormatter
+    import fcntl
 except ImportError:
-    class CustomRichHelpFormatter(argparse.HelpFormatter):
-        """Fallback formatter if licface is not installed."""
-        def __init__(self, prog):
-            super().__init__(prog, max_help_position=30, width=120)
-            
-from rich import traceback as rich_traceback
+    fcntl = None
+
 import os
-rich_traceback.install(show_locals=False, theme='fruity', width=os.get_terminal_size().columns, extra_lines=1, word_wrap=True)
-console = Console()
+
+# rich is imported on first use so --help and --version never load it
+_console_instance = None
+
+
+def _console():
+    """Return the shared rich Console, creating it on first use"""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+
+# Positional entry delimiters, in order of precedence
+_DELIMITERS = (",", "\n", ";", ":", "|", " ")
+_DELIMITER_SET = frozenset(_DELIMITERS)
+_WRAPPER_RE = re.compile(r"([\[{\"'`])(.*)([\]}\"'`])", re.DOTALL)
+_WRAPPER_PAIRS = {"[": "]", "{": "}", '"': '"', "'": "'", "`": "`"}
+
+
+def split_entry(entry: str) -> List[str]:
+    """Split a positional entry on its highest-precedence delimiter, unwrapping [..]/{..} lists and quotes"""
+    entry = entry.replace("\\", "/")
+
+    # Only a single wrapped value counts: "'a' 'b'" holds two quoted entries, not one
+    match = _WRAPPER_RE.fullmatch(entry)
+    if match and _WRAPPER_PAIRS[match.group(1)] == match.group(3) and match.group(3) not in match.group(2):
+        if match.group(1) not in "[{":
+            return [match.group(2)]
+        entry = match.group(2)
+
+    found = _DELIMITER_SET.intersection(entry)
+    for delim in _DELIMITERS:
+        if delim in found:
+            if delim == "\n":
+                return entry.splitlines()
+            if delim == " ":
+                return entry.split()
+            return entry.split(delim)
+
+    return [entry.strip() or entry]
+
+
+def _terminal_width(default: int = 120) -> int:
+    """Terminal width, or default when stdout is not a terminal (get_terminal_size() raises then)"""
+    try:
+        return os.get_terminal_size().columns
+    except OSError:
+        return default
+
+
+def _import_urllib3():
+    """Import the optional urllib3 on first network use, returning None when it is not installed"""
+    try:
+        import urllib3
+    except ImportError:
+        return None
+    return urllib3
+
+
+def _help_formatter():
+    """Return licface's help formatter, imported only when help is actually shown"""
+    try:
+        from licface import CustomRichHelpFormatter
+        return CustomRichHelpFormatter
+    except ImportError:
+        class CustomRichHelpFormatter(argparse.HelpFormatter):
+            """Fallback formatter if licface is not installed."""
+            def __init__(self, prog):
+                super().__init__(prog, max_help_position=30, width=120)
+        return CustomRichHelpFormatter
+
+
+def _wants_help(argv: List[str]) -> bool:
+    """Tell whether argparse will print help for argv: --help or an abbreviation of it, or -h in a short-flag cluster"""
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg.startswith("--"):
+            if len(arg) > 2 and "--help".startswith(arg):
+                return True
+        elif arg.startswith("-"):
+            for char in arg[1:]:
+                if char == "h":
+                    return True
+                # The rest of the cluster is the value of -p, -d or -t
+                if char in "pdt":
+                    break
+    return False
+
+
+def _print_traceback() -> None:
+    """Render the exception being handled with rich; only imports rich.traceback when something failed"""
+    _console().print_exception(show_locals=False, theme='fruity', width=_terminal_width(), extra_lines=1, word_wrap=True)
 
 class GitignoreGenerator:
     DEFAULT_ENTRIES = [
@@ -37,6 +131,8 @@ class GitignoreGenerator:
         ".hg/", "build/", "*.hgignore", "*.hgtags", "*dist/", "*.egg-info/", "traceback.log",
         "__pycache__/", "*.log"
     ]
+    _DEFAULT_BLOB = ("\n".join(DEFAULT_ENTRIES) + "\n").encode("utf-8")
+    _DEFAULT_SET: FrozenSet[str] = frozenset(DEFAULT_ENTRIES)
 
     ICONS = {
         "start": "🚀",
@@ -46,20 +142,211 @@ class GitignoreGenerator:
         "prompt": "❓"
     }
 
+    API_URL = "https://www.toptal.com/developers/gitignore/api/"
+    HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; GitignoreGenerator/1.0)"}
+    TIMEOUT = 10
+    MAX_WORKERS = 8
+    _pool = None
+    _pool_lock = threading.Lock()
+
+    # Show the write spinner only from this many bytes of entries up
+    SPINNER_THRESHOLD = 32 * 1024
+
+    # read_gitignore() prints files larger than this many bytes without highlighting
+    HIGHLIGHT_LIMIT = 8 * 1024
+
+    # Seconds a fetched template stays fresh in the disk cache (override with GITIGNORE_CACHE_TTL)
+    CACHE_TTL = 7 * 24 * 60 * 60
+    # Seconds a failed fetch (unknown template or timeout) is remembered before it is retried
+    NEG_CACHE_TTL = 60
+
+    @classmethod
+    def cache_dir(cls) -> Path:
+        """Return the template cache directory ($XDG_CACHE_HOME/gitignore or ~/.cache/gitignore), RuntimeError if there is no home"""
+        return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gitignore"
+
     @classmethod
-    def fetch_template(cls, templates: List[str]) -> List[str]:
+    def cache_ttl(cls) -> float:
         try:
-            url = f"https://www.toptal.com/developers/gitignore/api/{','.join(templates)}"
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; GitignoreGenerator/1.0)"}
-            )
-            with urllib.request.urlopen(req) as res:
-                content = res.read().decode()
-                return content.strip().splitlines()
+            return float(os.environ.get("GITIGNORE_CACHE_TTL", cls.CACHE_TTL))
+        except ValueError:
+            return cls.CACHE_TTL
+
+    @classmethod
+    def cache_key(cls, templates: List[str]) -> str:
+        return hashlib.sha1(",".join(sorted(set(templates))).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def read_cache(cls, key: str) -> Optional[str]:
+        """Return cached template content for key, or None if missing or expired"""
+        try:
+            cache_file = cls.cache_dir() / f"{key}.txt"
+            if time.time() - cache_file.stat().st_mtime < cls.cache_ttl():
+                return cache_file.read_text(encoding="utf-8")
+        except (OSError, RuntimeError):
+            pass
+        return None
+
+    @classmethod
+    def write_cache(cls, key: str, content: str, templates: List[str], url: str) -> None:
+        """Atomically store fetched content plus a small JSON sidecar with fetch metadata"""
+        try:
+            cache_dir = cls.cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            meta = {"templates": sorted(set(templates)), "url": url, "fetched_at": time.time()}
+            for name, data in ((f"{key}.txt", content), (f"{key}.json", json.dumps(meta))):
+                tmp = cache_dir / f"{name}.{os.getpid()}.tmp"
+                tmp.write_text(data, encoding="utf-8")
+                tmp.replace(cache_dir / name)
+            # A successful fetch supersedes an earlier failure
+            (cache_dir / f"{key}.neg").unlink()
+        except (OSError, RuntimeError):
+            # The cache is best effort, a read-only or missing home must not break generation
+            pass
+
+    @classmethod
+    def read_negative_cache(cls, key: str) -> bool:
+        """Return True if fetching key failed for good (4xx or timeout) less than NEG_CACHE_TTL seconds ago"""
+        try:
+            return time.time() - (cls.cache_dir() / f"{key}.neg").stat().st_mtime < cls.NEG_CACHE_TTL
+        except (OSError, RuntimeError):
+            return False
+
+    @classmethod
+    def write_negative_cache(cls, key: str) -> None:
+        try:
+            cache_dir = cls.cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / f"{key}.neg").touch()
+        except (OSError, RuntimeError):
+            pass
+
+    @classmethod
+    def _is_permanent_failure(cls, error: Exception) -> bool:
+        """Tell failures worth remembering (bad template names, timeouts) from transient ones"""
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in (400, 404)
+        # urllib3 can only have raised the error if it was imported already
+        urllib3 = sys.modules.get("urllib3")
+        # URLError and urllib3's MaxRetryError carry the underlying error as .reason
+        for err in (error, getattr(error, "reason", None)):
+            if isinstance(err, socket.timeout):
+                return True
+            if urllib3 is not None and isinstance(err, urllib3.exceptions.TimeoutError):
+                return True
+        return False
+
+    @classmethod
+    def _get_pool(cls):
+        """Return the shared urllib3 pool, created once and reused so later requests skip the TLS handshake"""
+        # Every fetch worker gets here at once on the first batch; the lock makes them share one pool
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = cls._create_pool()
+        return cls._pool
+
+    @classmethod
+    def _create_pool(cls):
+        urllib3 = _import_urllib3()
+        # urllib3 retries 3 times by default, which would stretch TIMEOUT to ~4x; fail a read timeout at once
+        options = dict(
+            maxsize=cls.MAX_WORKERS,
+            headers=cls.HEADERS,
+            timeout=cls.TIMEOUT,
+            retries=urllib3.Retry(total=2, connect=1, read=0, redirect=2)
+        )
+        proxy = urllib.request.getproxies().get("https")
+        if proxy:
+            return urllib3.ProxyManager(proxy, **options)
+        return urllib3.PoolManager(**options)
+
+    @classmethod
+    def _http_get(cls, url: str) -> str:
+        """GET url, through the shared urllib3 pool when available, raising HTTPError on non-200"""
+        if _import_urllib3() is not None:
+            res = cls._get_pool().request("GET", url)
+            if res.status != 200:
+                raise urllib.error.HTTPError(url, res.status, res.reason, res.headers, None)
+            return res.data.decode("utf-8")
+
+        with urllib.request.urlopen(urllib.request.Request(url, headers=cls.HEADERS), timeout=cls.TIMEOUT) as res:
+            return res.read().decode("utf-8")
+
+    @classmethod
+    def _fetch_one(cls, templates: List[str], use_cache: bool = True) -> str:
+        """Fetch a single gitignore.io response, serving it from the disk cache when fresh"""
+        key = cls.cache_key(templates)
+        if use_cache:
+            content = cls.read_cache(key)
+            if content is not None:
+                return content
+            if cls.read_negative_cache(key):
+                _console().print(f"[yellow]Skipping {','.join(templates)}: it failed less than {cls.NEG_CACHE_TTL}s ago (use --refresh to retry)[/yellow]")
+                return ""
+
+        try:
+            url = cls.API_URL + ",".join(templates)
+            content = cls._http_get(url)
+            cls.write_cache(key, content, templates, url)
+            return content
         except Exception as e:
-            console.print(f"{cls.ICONS['error']} [bold red]Failed fetch template from gitignore.io:[/bold red] {e}")
-            return []
+            if cls._is_permanent_failure(e):
+                cls.write_negative_cache(key)
+            _console().print(f"{cls.ICONS['error']} [bold red]Failed fetch template {','.join(templates)} from gitignore.io:[/bold red] {e}")
+            return ""
+
+    @classmethod
+    def fetch_template(cls, templates: List[str], use_cache: bool = True) -> str:
+        """Return the merged gitignore.io content for templates, newline terminated ("" on failure)"""
+        names = list(dict.fromkeys(templates))
+        if not names:
+            return ""
+
+        # Serve fully cached sets without importing any of the network machinery
+        cached = [cls.read_cache(cls.cache_key([name])) if use_cache else None for name in names]
+        if None not in cached:
+            results = [cls._merge_responses(names, cached)]
+        elif _import_urllib3() is None:
+            # Without a connection pool a single combined request is cheaper than N handshakes
+            results = [cls._fetch_one(names, use_cache)]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # One request per missing template so each is cached on its own and they all run in ~1 RTT
+            misses = [name for name, result in zip(names, cached) if result is None]
+            with ThreadPoolExecutor(max_workers=min(cls.MAX_WORKERS, len(misses))) as executor:
+                fetched = dict(zip(misses, executor.map(lambda name: cls._fetch_one([name], use_cache), misses)))
+            results = [fetched[name] if result is None else result for name, result in zip(names, cached)]
+            results = [cls._merge_responses([name for name, result in zip(names, results) if result], results)]
+
+        content = "\n".join(result.strip() for result in results if result)
+        return content + "\n" if content else ""
+
+    @classmethod
+    def _merge_responses(cls, names: List[str], responses: List[str]) -> str:
+        """Merge per-template responses under one Created by / End of pair, like a combined request returns"""
+        bodies = []
+        for response in responses:
+            body = response.strip()
+            if body.startswith("# Created by "):
+                # The header ends at the first blank line
+                start = body.find("\n\n")
+                body = body[start:].strip() if start != -1 else ""
+            end = body.rfind("# End of ")
+            if end != -1 and "\n" not in body[end:]:
+                body = body[:end].rstrip()
+            if body:
+                bodies.append(body)
+
+        if not bodies:
+            return ""
+        joined = ",".join(names)
+        return (
+            f"# Created by {cls.API_URL}{joined}\n"
+            f"# Edit at https://www.toptal.com/developers/gitignore?templates={joined}\n\n"
+            + "\n\n".join(bodies)
+            + f"\n\n# End of {cls.API_URL}{joined}\n"
+        )
 
     @classmethod
     def read_existing_gitignore(cls, path: Path) -> Set[str]:
@@ -67,22 +354,23 @@ class GitignoreGenerator:
         gitignore_path = path / ".gitignore"
         existing_entries = set()
         
-        if gitignore_path.exists():
-            try:
-                with gitignore_path.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip empty lines and comments
-                        if line and not line.startswith('#'):
-                            existing_entries.add(line)
-            except Exception as e:
-                console.print(f"{cls.ICONS['error']} [bold yellow]Warning: Could not read existing .gitignore:[/bold yellow] {e}")
+        try:
+            with gitignore_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    # Skip empty lines and comments
+                    if line and not line.startswith('#'):
+                        existing_entries.add(line)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _console().print(f"{cls.ICONS['error']} [bold yellow]Warning: Could not read existing .gitignore:[/bold yellow] {e}")
         
         return existing_entries
 
     @classmethod
     def remove_duplicates(cls, entries: List[str], existing_entries: Set[str] = None) -> List[str]:
-        """Remove duplicates from entries list while preserving order and comments"""
+        """Remove duplicates from entries list while preserving order and comments, collapsing blank-line runs"""
         if existing_entries is None:
             existing_entries = set()
             
@@ -91,8 +379,11 @@ class GitignoreGenerator:
         
         for entry in entries:
             entry = entry.strip()
-            # Keep comments and empty lines as-is
-            if not entry or entry.startswith('#'):
+            # Keep comments as-is; keep a blank line only as a single separator after an entry
+            if not entry:
+                if unique_entries and unique_entries[-1]:
+                    unique_entries.append(entry)
+            elif entry.startswith('#'):
                 unique_entries.append(entry)
             elif entry not in seen:
                 seen.add(entry)
@@ -100,6 +391,82 @@ class GitignoreGenerator:
                 
         return unique_entries
 
+    @classmethod
+    def _encode(cls, entries: List[str]) -> bytes:
+        return ("\n".join(entries) + "\n").encode("utf-8") if entries else b""
+
+    @classmethod
+    def _write_buffers(cls, fd: int, buffers: List[bytes]) -> None:
+        if not hasattr(os, "writev"):
+            # Windows has no writev
+            for buffer in buffers:
+                while buffer:
+                    buffer = buffer[os.write(fd, buffer):]
+            return
+
+        # Hand all sections to the kernel in one writev() instead of one write() each
+        while buffers:
+            written = os.writev(fd, buffers)
+            # Drop what went out; a short write leaves the unwritten tail of one buffer
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers.pop(0))
+            if written:
+                buffers[0] = buffers[0][written:]
+
+    @classmethod
+    def _write_entries(
+        cls,
+        gitignore_path: Path,
+        sections: List[bytes],
+        count: int,
+        append: bool,
+        st: Optional[os.stat_result] = None
+    ) -> None:
+        """Write pre-encoded sections to .gitignore: appends run under an exclusive lock, overwrites are renamed into place"""
+        buffers = [section for section in sections if section]
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+        if append:
+            # Add a separator comment when appending
+            buffers.insert(0, f"\n# Added entries ({count} items)\n".encode("utf-8"))
+            fd = os.open(gitignore_path, flags | os.O_APPEND, 0o666)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                cls._write_buffers(fd, buffers)
+            finally:
+                # Closing the descriptor releases the lock
+                os.close(fd)
+            return
+
+        # Replace the link target, not the link itself; a dangling link gets its target created
+        if st is not None and stat.S_ISLNK(st.st_mode):
+            gitignore_path = Path(os.path.realpath(gitignore_path))
+            try:
+                st = os.stat(gitignore_path)
+            except FileNotFoundError:
+                st = None
+
+        # A random suffix keeps a temp file left by a killed run (PIDs get reused) from blocking later writes
+        tmp = gitignore_path.with_name(f"{gitignore_path.name}.tmp.{os.getpid()}.{os.urandom(4).hex()}")
+        # 0o666 leaves new files to the umask, like write_text() did
+        fd = os.open(tmp, flags | os.O_EXCL, 0o666)
+        try:
+            try:
+                if st is not None:
+                    # Keep the permissions of the file being replaced
+                    os.chmod(tmp, stat.S_IMODE(st.st_mode))
+                cls._write_buffers(fd, buffers)
+            finally:
+                os.close(fd)
+            os.replace(tmp, gitignore_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
     @classmethod
     def generate(
         cls,
@@ -108,99 +475,169 @@ class GitignoreGenerator:
         append: bool = False,
         force: bool = False,
         templates: Optional[List[str]] = None,
-        include_defaults: bool = True
+        include_defaults: bool = True,
+        use_cache: bool = True,
+        dedupe: bool = True
     ) -> None:
-        entries = []
-        
+        # Stat once up front and reuse the result for every existence decision below
+        gitignore_path = path / ".gitignore"
+        try:
+            st = os.lstat(gitignore_path)
+        except (FileNotFoundError, NotADirectoryError):
+            # Like Path.exists(): a -p that is not a directory fails later, in the handled write path
+            st = None
+        except OSError as e:
+            _console().print(f"{cls.ICONS['error']} [bold red]Failed to write .gitignore:[/bold red] {e}")
+            return
+        exists = st is not None
+
         # Read existing entries if appending
         existing_entries = set()
-        if append:
+        if append and exists:
             existing_entries = cls.read_existing_gitignore(path)
 
-        # Add template entries first
+        # Template entries go first, then the defaults, then extra entries.
+        # The fetched text is encoded once: after deduplication, or as-is without dedupe.
+        seen = set(existing_entries)
+        template_blob = b""
+        template_count = 0
         if templates:
-            template_entries = cls.fetch_template(templates)
-            entries += template_entries
+            template_text = cls.fetch_template(templates, use_cache=use_cache)
+            if dedupe:
+                template_entries = cls.remove_duplicates(template_text.splitlines(), seen)
+                seen.update(template_entries)
+                template_blob = cls._encode(template_entries)
+                template_count = len(template_entries)
+            else:
+                template_blob = template_text.encode("utf-8")
+                template_count = template_text.count("\n")
+                # Needed only to keep later sections from repeating (and overriding) template patterns
+                if include_defaults or extra_entries:
+                    seen.update(line.strip() for line in template_text.splitlines())
+
+        # Add default entries only if explicitly requested AND (not appending OR file doesn't exist).
+        # Git applies the last matching pattern, so a default repeated after the template would override
+        # the template's own ordering (e.g. a later "!keep.log"); drop those defaults rather than the template lines.
+        defaults_blob = b""
+        defaults_count = 0
+        if include_defaults and (not append or not exists):
+            if cls._DEFAULT_SET.isdisjoint(seen):
+                defaults_blob = cls._DEFAULT_BLOB
+                defaults_count = len(cls.DEFAULT_ENTRIES)
+            else:
+                defaults = [entry for entry in cls.DEFAULT_ENTRIES if entry not in seen]
+                defaults_blob = cls._encode(defaults)
+                defaults_count = len(defaults)
+            seen |= cls._DEFAULT_SET
 
-        # Add default entries only if explicitly requested AND (not appending OR file doesn't exist)
-        gitignore_path = path / ".gitignore"
-        if include_defaults and (not append or not gitignore_path.exists()):
-            entries += cls.DEFAULT_ENTRIES
+        # Blank user entries carry no pattern, drop them before deduplicating
+        extra_entries = cls.remove_duplicates([entry for entry in extra_entries or [] if entry.strip()], seen)
 
-        # Add extra entries
-        if extra_entries:
-            entries += extra_entries
+        count = template_count + defaults_count + len(extra_entries)
+        sections = [template_blob, defaults_blob, cls._encode(extra_entries)]
 
-        # Remove duplicates
-        entries = cls.remove_duplicates(entries, existing_entries)
-        
         # Skip if no new entries to add
-        if not entries:
-            console.print("[yellow]No new entries to add to .gitignore.[/yellow]")
+        if not count:
+            _console().print("[yellow]No new entries to add to .gitignore.[/yellow]")
             return
 
-        if gitignore_path.exists() and not force and not append:
+        # Rewriting a file that already holds exactly this content is a no-op; sizes differ cheaply otherwise
+        if exists and not append:
+            try:
+                # lstat() gave the link's own size for a symlink; compare against its target
+                size = os.stat(gitignore_path).st_size if stat.S_ISLNK(st.st_mode) else st.st_size
+                unchanged = False
+                if size == sum(map(len, sections)):
+                    with gitignore_path.open("rb") as f:
+                        unchanged = f.read() == b"".join(sections)
+            except OSError:
+                unchanged = False
+            if unchanged:
+                _console().print(f"[green].gitignore at {gitignore_path} is already up to date.[/green]")
+                return
+
+        if exists and not force and not append:
+            # Nobody can answer the prompt when stdin is redirected, so keep the file instead of blocking
+            if not sys.stdin.isatty():
+                _console().print(f"[yellow].gitignore already exists at {gitignore_path}; use --force or --append.[/yellow]")
+                return
             answer = input(f"{cls.ICONS['prompt']} .gitignore file already exists at {gitignore_path}. Overwrite? [y/N] ").strip().lower()
             if answer != 'y':
-                console.print("[yellow]Canceled.[/yellow]")
+                _console().print("[yellow]Canceled.[/yellow]")
                 return
 
-        try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                transient=True,
-                console=console,
-            ) as progress:
-                task = progress.add_task("[cyan]Writing .gitignore file...", total=None)
-
-                content = "\n".join(entries)
-                if content and not content.endswith('\n'):
-                    content += "\n"
-
-                if append and gitignore_path.exists():
-                    # Add a separator comment when appending
-                    if entries:
-                        separator = f"\n# Added entries ({len(entries)} items)\n"
-                        with gitignore_path.open("a", encoding="utf-8") as f:
-                            f.write(separator + content)
-                else:
-                    gitignore_path.write_text(content, encoding="utf-8")
+        from rich.panel import Panel
 
-                progress.update(task, description="[green]Finished writing .gitignore")
-                progress.stop()
+        try:
+            # The spinner costs more than small writes take, so only show it for big files on a terminal
+            if sys.stdout.isatty() and sum(map(len, sections)) >= cls.SPINNER_THRESHOLD:
+                from rich.progress import Progress, SpinnerColumn, TextColumn
+
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    transient=True,
+                    console=_console(),
+                ) as progress:
+                    task = progress.add_task("[cyan]Writing .gitignore file...", total=None)
+                    cls._write_entries(gitignore_path, sections, count, append and exists, st)
+                    progress.update(task, description="[green]Finished writing .gitignore")
+                    progress.stop()
+            else:
+                cls._write_entries(gitignore_path, sections, count, append and exists, st)
 
-            action = "appended to" if append and gitignore_path.exists() else "created at"
-            console.print(Panel.fit(
+            action = "appended to" if append and exists else "created at"
+            _console().print(Panel.fit(
                 f"{cls.ICONS['done']} [bold green].gitignore successfully {action}:[/bold green] {gitignore_path}",
                 border_style="green"
             ))
             
-            console.print(f"[dim]Added {len(entries)} entries.[/dim]")
+            _console().print(f"[dim]Added {count} entries.[/dim]")
                 
         except Exception as e:
-            console.print(
+            _console().print(
                 f"{cls.ICONS['error']} [bold red]Failed to write .gitignore:[/bold red] {e}"
             )
 
     @classmethod
     def read_gitignore(cls, path: Path) -> None:
-        """Read .gitignore with rich.syntax Syntax Coloring."""
+        """Read .gitignore with rich.syntax Syntax Coloring, or raw for large files and non-terminals."""
         gitignore_path = path / ".gitignore"
-        if not gitignore_path.exists():
-            console.print(f"{cls.ICONS['error']} [bold red].gitignore file does not exist at {gitignore_path}[/bold red]")
+        try:
+            size = gitignore_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            _console().print(f"{cls.ICONS['error']} [bold red].gitignore file does not exist at {gitignore_path}[/bold red]")
+            return
+        except OSError as e:
+            # e.g. a symlink loop or a directory we may not enter
+            _console().print(f"{cls.ICONS['error']} [bold red]Failed to read .gitignore:[/bold red] {e}")
+            return
+
+        # Highlighting large files costs far more than it helps, and pipes want the plain content
+        if size > cls.HIGHLIGHT_LIMIT or not sys.stdout.isatty():
+            try:
+                sys.stdout.flush()
+                if size:
+                    with gitignore_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        sys.stdout.buffer.write(mm)
+                sys.stdout.buffer.flush()
+            except Exception as e:
+                _console().print(f"{cls.ICONS['error']} [bold red]Failed to read .gitignore:[/bold red] {e}")
             return
 
+        from rich.syntax import Syntax
+        from rich.panel import Panel
+
         try:
             content = gitignore_path.read_text(encoding="utf-8")
             syntax = Syntax(content, "gitignore", word_wrap=True)
-            console.print(Panel.fit(
+            _console().print(Panel.fit(
                 syntax,
                 title=f"{cls.ICONS['write']} [bold blue]Content of .gitignore[/bold blue]",
                 border_style="blue"
             ))
         except Exception as e:
-            console.print(f"{cls.ICONS['error']} [bold red]Failed to read .gitignore:[/bold red] {e}")
+            _console().print(f"{cls.ICONS['error']} [bold red]Failed to read .gitignore:[/bold red] {e}")
             
 
 class GitCleaner:
@@ -215,9 +652,10 @@ class GitCleaner:
     @classmethod
     def clean_gitignore(cls, file_path: Path, backup: bool = True) -> None:
         """Clean duplicate entries from .gitignore file"""
-        
+        from rich.panel import Panel
+
         if not file_path.exists():
-            console.print(f"[bold red]{cls.ICONS['error']} Error:[/bold red] {file_path} does not exist.")
+            _console().print(f"[bold red]{cls.ICONS['error']} Error:[/bold red] {file_path} does not exist.")
             return
         
         try:
@@ -229,7 +667,7 @@ class GitCleaner:
             if backup:
                 backup_path = file_path.with_suffix('.gitignore.bak')
                 backup_path.write_text(''.join(lines), encoding='utf-8')
-                console.print(f"[dim]Backup created: {backup_path}[/dim]")
+                _console().print(f"[dim]Backup created: {backup_path}[/dim]")
             
             # Process lines to remove duplicates
             seen = set()
@@ -253,7 +691,7 @@ class GitCleaner:
                 with file_path.open('w', encoding='utf-8') as f:
                     f.writelines(cleaned_lines)
                 
-                console.print(Panel.fit(
+                _console().print(Panel.fit(
                     f"[bold green]{cls.ICONS['done']} Cleaned {file_path}[/bold green]\n"
                     f"[dim]• Removed {removed_count} duplicate entries\n"
                     f"• Total unique entries: {len(seen)}[/dim]",
@@ -261,17 +699,18 @@ class GitCleaner:
                     title="Cleanup Complete"
                 ))
             else:
-                console.print(f"[yellow]No duplicates found in {file_path}[/yellow]")
+                _console().print(f"[yellow]No duplicates found in {file_path}[/yellow]")
                 
         except Exception as e:
-            console.print(f"[bold red]{cls.ICONS['error']} Error processing {file_path}:[/bold red] {e}")
+            _console().print(f"[bold red]{cls.ICONS['error']} Error processing {file_path}:[/bold red] {e}")
 
     @classmethod
     def preview_changes(cls, file_path: Path) -> None:
         """Preview what would be removed without making changes"""
-        
+        from rich.panel import Panel
+
         if not file_path.exists():
-            console.print(f"[bold red]{cls.ICONS['error']} Error:[/bold red] {file_path} does not exist.")
+            _console().print(f"[bold red]{cls.ICONS['error']} Error:[/bold red] {file_path} does not exist.")
             return
         
         try:
@@ -293,7 +732,7 @@ class GitCleaner:
                         unique_count += 1
             
             if duplicates:
-                console.print(Panel.fit(
+                _console().print(Panel.fit(
                     f"[bold yellow]Preview for {file_path}[/bold yellow]\n\n"
                     f"[dim]Duplicate entries that would be removed:[/dim]\n" +
                     "\n".join([f"Line {line_num}: {entry}" for line_num, entry in duplicates[:10]]) +
@@ -304,10 +743,10 @@ class GitCleaner:
                     title="Preview Mode"
                 ))
             else:
-                console.print(f"[green]No duplicates found in {file_path}[/green]")
+                _console().print(f"[green]No duplicates found in {file_path}[/green]")
                 
         except Exception as e:
-            console.print(f"[bold red]{cls.ICONS['error']} Error previewing {file_path}:[/bold red] {e}")
+            _console().print(f"[bold red]{cls.ICONS['error']} Error previewing {file_path}:[/bold red] {e}")
 
 
 def get_version():
@@ -330,17 +769,27 @@ def get_version():
             return "0.0.0"  # Fallback if version file is not found
     except Exception as e:
         if os.getenv('TRACEBACK') and os.getenv('TRACEBACK') in ['1', 'true', 'True']:
-            console.print_exception(show_locals=False, theme='fruity', width=os.get_terminal_size().columns, extra_lines=1, word_wrap=True)
+            _console().print_exception(show_locals=False, theme='fruity', width=_terminal_width(), extra_lines=1, word_wrap=True)
         else:
-            console.print(f"ERROR: {e}")
+            _console().print(f"ERROR: {e}")
 
     return "0.0.0"
             
 
 def main():
+    try:
+        _run()
+    except Exception:
+        _print_traceback()
+        sys.exit(1)
+
+
+def _run():
+    # Help is printed for a bare invocation and for -h/--help; everything else keeps the stock formatter
+    show_help = len(sys.argv) == 1 or _wants_help(sys.argv[1:])
     parser = argparse.ArgumentParser(
         description="Generate .gitignore with default data, additional entries, or templates.",
-        formatter_class=CustomRichHelpFormatter,
+        formatter_class=_help_formatter() if show_help else argparse.HelpFormatter,
         prog='gitign'
     )
     
@@ -364,11 +813,20 @@ def main():
         "-a", "--append", action="store_true", help="Add to .gitignore without overwrite"
     )
     parser.add_argument(
-        "-f", "--force", action="store_true", help="Skip the prompt if .gitignore already exists"
+        "-f", "-y", "--force", "--yes", dest="force", action="store_true",
+        help="Skip the prompt if .gitignore already exists"
     )
     parser.add_argument(
         "--no-defaults", action="store_true", help="Don't include default entries"
     )
+    parser.add_argument(
+        "--no-cache", "--refresh", dest="no_cache", action="store_true",
+        help="Ignore cached templates and fetch them again from gitignore.io"
+    )
+    parser.add_argument(
+        "--no-dedupe", action="store_true",
+        help="Write fetched templates verbatim, without dropping entries that are already present"
+    )
     parser.add_argument('-r', '--read', action='store_true', help='Read .gitignore file and print its content')
     parser.add_argument('-v', '--version', action='version', version=f'gitign {get_version()}',
                         help='Show the version of this script')
@@ -389,7 +847,7 @@ def main():
 
     if len(sys.argv) == 1:
         parser.print_help()
-        console.print(f"\n{GitignoreGenerator.ICONS['start']} [bold blue]Starting to create .gitignore ...[/bold blue]")
+        _console().print(f"\n{GitignoreGenerator.ICONS['start']} [bold blue]Starting to create .gitignore ...[/bold blue]")
         GitignoreGenerator.generate(path=Path("."))
         sys.exit(0)
         
@@ -398,8 +856,8 @@ def main():
     # Handle clean command
     if args.clean:
         gitignore_path = args.path / ".gitignore"
-        console.print(f"[bold blue]{GitCleaner.ICONS['clean']} GitIgnore Cleaner[/bold blue]")
-        console.print(f"[dim]Target: {gitignore_path}[/dim]\n")
+        _console().print(f"[bold blue]{GitCleaner.ICONS['clean']} GitIgnore Cleaner[/bold blue]")
+        _console().print(f"[dim]Target: {gitignore_path}[/dim]\n")
         
         if args.preview:
             GitCleaner.preview_changes(gitignore_path)
@@ -408,42 +866,14 @@ def main():
         return
 
     # Process positional entries
-    if args.entries:
-        for entrie in args.entries:
-            # Replace \ to /
-            entrie = entrie.replace("\\", "/")
-            if "," in entrie:
-                args.data.extend(entrie.split(","))
-            elif "\n" in entrie:
-                args.data.extend(entrie.splitlines())
-            elif ";" in entrie:
-                args.data.extend(entrie.split(";"))
-            elif ":" in entrie:
-                args.data.extend(entrie.split(":"))
-            elif "|" in entrie:
-                args.data.extend(entrie.split("|"))
-            elif " " in entrie:
-                args.data.extend(entrie.split())
-            elif entrie.startswith("[") and entrie.endswith("]"):
-                args.data.extend(entrie[1:-1].split(","))
-            elif entrie.startswith("{") and entrie.endswith("}"):
-                args.data.extend(entrie[1:-1].split(","))
-            elif entrie.startswith('"') and entrie.endswith('"'):
-                args.data.append(entrie[1:-1])
-            elif entrie.startswith("'") and entrie.endswith("'"):
-                args.data.append(entrie[1:-1])
-            elif entrie.startswith("`") and entrie.endswith("`"):
-                args.data.append(entrie[1:-1])
-            elif entrie.strip():
-                args.data.append(entrie.strip())
-            else:
-                args.data.append(entrie)
+    for entrie in args.entries:
+        args.data.extend(split_entry(entrie))
             
     if args.read:
         GitignoreGenerator.read_gitignore(path=args.path)
         return
 
-    console.print(f"{GitignoreGenerator.ICONS['start']} [bold blue]Starting to create .gitignore ...[/bold blue]")
+    _console().print(f"{GitignoreGenerator.ICONS['start']} [bold blue]Starting to create .gitignore ...[/bold blue]")
     
     # Automatically use append mode if .gitignore exists and user provided entries
     auto_append = False
@@ -457,7 +887,9 @@ def main():
         append=args.append or auto_append,
         force=args.force,
         templates=args.template,
-        include_defaults=not args.no_defaults
+        include_defaults=not args.no_defaults,
+        use_cache=not args.no_cache,
+        dedupe=not args.no_dedupe
     )
 
 